@@ -2,16 +2,17 @@
 AmbientWindow - Small floating orb that appears in the corner when not actively using the app
 """
 
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter, QScreen, QColor
 from PySide6.QtWidgets import QWidget, QApplication
-from opensimplex import OpenSimplex
-import math
+import numpy as np
 
 
 class AmbientWindow(QWidget):
     """Small floating orb that appears in the corner when not actively using the app"""
     
+    NUM_POINTS = 30  # Fewer points for smaller orb
+    
     def __init__(self, renderer, app_controller=None, vision_manager=None):
         super().__init__()
         self.renderer = renderer
@@ -20,20 +21,24 @@ class AmbientWindow(QWidget):
         self.state = 'idle'  # Start in idle state
         self.face_pos = (0.5, 0.5)  # Default to center
         
-        # Animation variables for the chaotic blob
-        self.time = 0.0
-        self.time2 = 0.0
-        self.time3 = 0.0
+        # Animation variables for the chaotic blob (layered noise state lives in the renderer)
         self.base_radius = 50  # Smaller radius for ambient orb
-        self.noise_scale = 0.9
-        self.noise_scale2 = 0.5
-        self.noise_scale3 = 0.1
-        self.noise_speed = 0.05
-        self.noise_speed2 = 0.03
-        self.noise_speed3 = 0.08
         
-        # OpenSimplex noise generator
-        self.noise_gen = OpenSimplex(seed=12345)
+        # Fixed sample angles around the outline, kept as flat float32 arrays (SoA)
+        angles = np.linspace(0, 2 * np.pi, self.NUM_POINTS, endpoint=False)
+        self._cos = np.cos(angles).astype(np.float32)
+        self._sin = np.sin(angles).astype(np.float32)
+        self._jitter_phase = np.arange(self.NUM_POINTS, dtype=np.float32) * 0.5  # Per-point phase of the jitter wave
+        
+        # Trig tables pre-scaled for each noise layer and the undeformed outline
+        self._layer_cos = self.renderer.scales[:, None] * self._cos
+        self._layer_sin = self.renderer.scales[:, None] * self._sin
+        self._rest_x = self._cos * self.base_radius
+        self._rest_y = self._sin * self.base_radius
+        
+        # Outline computed by the last tick, and the renderer's record of the last paint
+        self._next_shape = None
+        self._painted = None
         
         # --- Set Window Flags for Ambient Mode ---
         self.setWindowFlags(
@@ -54,82 +59,58 @@ class AmbientWindow(QWidget):
             orb_size
         )
         
-        # --- Animation Timer ---
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.animate_blob)
-        self.timer.start(20)  # 50fps
-        
     def animate_blob(self):
         """Animation loop for the ambient orb"""
-        # Increment time counters for layered noise
-        self.time += self.noise_speed
-        self.time2 += self.noise_speed2
-        self.time3 += self.noise_speed3
+        # Advance the shared layered noise
+        self.renderer.tick()
         
-        # Trigger redraw
-        self.update()
+        # Only redraw when something visible changed since the last paint
+        xs, ys = self._next_shape = self.create_blob_shape()
+        if self.renderer.needs_repaint(self._painted, xs, ys, self.state, self.face_pos, self.width()):
+            self.update()
     
     def create_blob_shape(self):
         """Create chaotic blob shape for the ambient orb"""
-        num_points = 30  # Fewer points for smaller orb
-        
-        points = []
         center_x = 75  # Center of 150x150 window
         center_y = 75
         
-        # Generate points around a circle with chaotic noise deformation
-        for i in range(num_points):
-            angle = (2 * math.pi * i) / num_points
-            radius = self.base_radius
-            
-            # Layer 1: Primary chaotic noise
-            noise_x1 = math.cos(angle) * self.noise_scale
-            noise_y1 = math.sin(angle) * self.noise_scale
-            noise_value1 = self.noise_gen.noise2(noise_x1 + self.time, noise_y1 + self.time)
-            
-            # Layer 2: Secondary noise
-            noise_x2 = math.cos(angle) * self.noise_scale2
-            noise_y2 = math.sin(angle) * self.noise_scale2
-            noise_value2 = self.noise_gen.noise2(noise_x2 + self.time2, noise_y2 + self.time2)
-            
-            # Layer 3: Tertiary noise
-            noise_x3 = math.cos(angle) * self.noise_scale3
-            noise_y3 = math.sin(angle) * self.noise_scale3
-            noise_value3 = self.noise_gen.noise2(noise_x3 + self.time3, noise_y3 + self.time3)
-            
-            # Combine noise layers
-            total_noise = (noise_value1 * 0.6) + (noise_value2 * 0.3) + (noise_value3 * 0.1)
-            
-            # Get eye protection points
-            eye_tips = self.renderer.get_eye_protection_points(self.width(), self.height())
-            
-            # Apply eye protection to reduce deformation near eyes
-            amplitude = 25  # Smaller deformation for ambient orb
-            protected_amplitude = self.renderer.eye_safe_amplitude(
-                center_x + math.cos(angle) * self.base_radius,
-                center_y + math.sin(angle) * self.base_radius,
-                amplitude, eye_tips, self.width() * 0.25
-            )
-            
-            radius += total_noise * protected_amplitude
-            
-            # Add randomness
-            random_factor = math.sin(self.time * 2 + i * 0.5) * 5
-            radius += random_factor
-            
-            # Calculate final position
-            x = center_x + math.cos(angle) * radius
-            y = center_y + math.sin(angle) * radius
-            points.append(QPointF(x, y))
-        
-        return points
+        # Sample the primary, secondary and tertiary noise layers in one batch
+        noise_values = self.renderer.sample_noise_layers(self._layer_cos, self._layer_sin)
+        
+        # Combine noise layers
+        total_noise = self.renderer.weights @ noise_values
+        
+        # Get eye protection points
+        eye_tips = self.renderer.get_eye_protection_points(self.width(), self.height())
+        
+        # Apply eye protection to reduce deformation near eyes
+        amplitude = 25  # Smaller deformation for ambient orb
+        protected_amplitude = self.renderer.eye_safe_amplitudes(
+            center_x + self._rest_x,
+            center_y + self._rest_y,
+            amplitude, eye_tips, self.width() * 0.25
+        )
+        
+        radius = self.base_radius + total_noise * protected_amplitude
+        
+        # Add randomness
+        radius += np.sin(float(self.renderer.times[0]) * 2 + self._jitter_phase) * 5
+        
+        # Calculate final positions
+        xs = center_x + self._cos * radius
+        ys = center_y + self._sin * radius
+        
+        return xs, ys
     
     def paintEvent(self, event):
         """Draw the ambient orb using the shared renderer"""
         painter = QPainter(self)
         
-        points = self.create_blob_shape()
-        self.renderer.render_blob(painter, points, self.state, self.face_pos)
+        if self._next_shape is None:
+            self._next_shape = self.create_blob_shape()
+        xs, ys = self._next_shape
+        self._painted = self.renderer.mark_painted(xs, ys, self.state, self.face_pos, self.width())
+        self.renderer.render_blob(painter, xs, ys, self.state, self.face_pos)
         
         # Properly end the painter
         painter.end()
@@ -1,10 +1,10 @@
 import sys
 
-from PySide6.QtCore import QSize, Qt, QTimer, QPointF
+from PySide6.QtCore import QSize, Qt, QTimer
 from PySide6.QtGui import QRegion, QPainter, QBrush, QColor, QPen, QPainterPath, QPolygonF, QRadialGradient, QLinearGradient
 from PySide6.QtWidgets import QApplication, QMainWindow
-from opensimplex import OpenSimplex
 import math
+import numpy as np
 from blob_renderer import BlobRenderer
 from ambient_window import AmbientWindow
 from vision import VisionManager
@@ -12,6 +12,8 @@ from vision import VisionManager
 
 # Subclass QMainWindow to customize your application's main window
 class ActiveWindow(QMainWindow):
+    NUM_POINTS = 40  # Increased number of points for smoother irregular shapes
+
     def __init__(self, shared_renderer, app_controller=None):
         super().__init__()
         self.app_controller = app_controller  # Reference to main app controller
@@ -25,40 +27,37 @@ class ActiveWindow(QMainWindow):
         self.state = 'idle'  # Current state: idle, listening, thinking, success, error
         self.face_pos = (0.5, 0.5)  # Default to center
          
+        # Use the shared renderer (it also owns the layered noise animation state)
+        self.blob_renderer = shared_renderer
+        
         # Animation variables for the chaotic blob
-        self.time = 0.0  # Time counter for Perlin noise
-        self.time2 = 0.0  # Secondary time counter for layered noise
-        self.time3 = 0.0  # Tertiary time counter for complex movement
         self.base_radius = 150  # Larger base size of the blob
-        self.noise_scale = 0.9  # Increased noise intensity for chaos
-        self.noise_scale2 = 0.5  # Secondary noise layer
-        self.noise_scale3 = 0.1  # Tertiary noise layer for fine details
-        self.noise_speed = 0.05  # Faster noise for chaotic movement
-        self.noise_speed2 = 0.03  # Different speed for secondary layer
-        self.noise_speed3 = 0.08  # Fast tertiary layer for fine chaos
 
         # State-specific animation variables
         self.state_timer = 0  # Timer for state-specific animations
         self.jump_height = 0  # For success state "jumping"
         self.wobble_offset = 0  # For error state "wobbling"
         
-        # OpenSimplex noise generator
-        self.noise_gen = OpenSimplex(seed=12345)
+        # Fixed sample angles around the outline, kept as flat float32 arrays (SoA)
+        angles = np.linspace(0, 2 * np.pi, self.NUM_POINTS, endpoint=False)
+        self._cos = np.cos(angles).astype(np.float32)
+        self._sin = np.sin(angles).astype(np.float32)
+        self._jitter_phase = np.arange(self.NUM_POINTS, dtype=np.float32) * 0.5  # Per-point phase of the jitter wave
         
-        # Use the shared renderer
-        self.blob_renderer = shared_renderer
-
-        # Setup animation timer
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.animate_blob)
-        self.timer.start(20)  # 50fps for smooth animation
+        # Trig tables pre-scaled for each noise layer and the undeformed outline
+        self._layer_cos = self.blob_renderer.scales[:, None] * self._cos
+        self._layer_sin = self.blob_renderer.scales[:, None] * self._sin
+        self._rest_x = self._cos * self.base_radius
+        self._rest_y = self._sin * self.base_radius
+        
+        # Outline computed by the last tick, and the renderer's record of the last paint
+        self._next_shape = None
+        self._painted = None
       
     def animate_blob(self):
         """Main animation loop - updates all animation variables"""
-        # Increment multiple time counters for layered noise
-        self.time += self.noise_speed
-        self.time2 += self.noise_speed2
-        self.time3 += self.noise_speed3
+        # Advance the shared layered noise
+        self.blob_renderer.tick()
         
         # State-specific animations
         if self.state == 'success':
@@ -77,8 +76,10 @@ class ActiveWindow(QMainWindow):
                 self.state = 'idle'
                 self.state_timer = 0
         
-        # Trigger redraw
-        self.update()
+        # Only redraw when something visible changed since the last paint
+        xs, ys = self._next_shape = self.create_blob_shape()
+        if self.blob_renderer.needs_repaint(self._painted, xs, ys, self.state, self.face_pos, self.width()):
+            self.update()
 
     def keyPressEvent(self, event):
         """Handle keyboard input to change states"""
@@ -103,12 +104,6 @@ class ActiveWindow(QMainWindow):
     
     def create_blob_shape(self):
         """Create chaotic Venom-like blob shape using multiple noise layers"""
-        # Increased number of points for smoother irregular shapes
-        num_points = 40
-        
-        # Create a list to store the points
-        points = []
-        
         # Calculate center position (dynamic based on window size)
         center_x = self.width() / 2
         center_y = self.height() / 2
@@ -119,60 +114,35 @@ class ActiveWindow(QMainWindow):
         elif self.state == 'error':
             center_x += self.wobble_offset
         
-        # Generate points around a circle with chaotic noise deformation
-        for i in range(num_points):
-            # Calculate angle for this point
-            angle = (2 * math.pi * i) / num_points
-            
-            # Base radius for this point
-            radius = self.base_radius
-            
-            # Layer 1: Primary chaotic noise (large deformations)
-            noise_x1 = math.cos(angle) * self.noise_scale
-            noise_y1 = math.sin(angle) * self.noise_scale
-            noise_value1 = self.noise_gen.noise2(noise_x1 + self.time, noise_y1 + self.time)
-            
-            # Layer 2: Secondary noise (medium deformations)
-            noise_x2 = math.cos(angle) * self.noise_scale2
-            noise_y2 = math.sin(angle) * self.noise_scale2
-            noise_value2 = self.noise_gen.noise2(noise_x2 + self.time2, noise_y2 + self.time2)
-            
-            # Layer 3: Tertiary noise (fine details and chaos)
-            noise_x3 = math.cos(angle) * self.noise_scale3
-            noise_y3 = math.sin(angle) * self.noise_scale3
-            noise_value3 = self.noise_gen.noise2(noise_x3 + self.time3, noise_y3 + self.time3)
-            
-            # Combine all noise layers for chaotic effect
-            total_noise = (noise_value1 * 0.6) + (noise_value2 * 0.3) + (noise_value3 * 0.1)
-            
-            # Get eye protection points
-            eye_tips = self.blob_renderer.get_eye_protection_points(self.width(), self.height())
-            protection_radius = self.width() * 0.25  # Larger protection zones
-            
-            
-            # Apply eye protection to reduce deformation near eyes
-            amplitude = 50  # Base deformation intensity
-            protected_amplitude = self.blob_renderer.eye_safe_amplitude(
-                center_x + math.cos(angle) * self.base_radius,
-                center_y + math.sin(angle) * self.base_radius,
-                amplitude, eye_tips, protection_radius
-            )
-            
-            # Apply chaotic noise to radius with eye protection
-            radius += total_noise * protected_amplitude
-            
-            # Add some randomness to make it even more chaotic
-            random_factor = math.sin(self.time * 2 + i * 0.5) * 10
-            radius += random_factor
-            
-            # Calculate final position
-            x = center_x + math.cos(angle) * radius
-            y = center_y + math.sin(angle) * radius
-            
-            # Add to points list
-            points.append(QPointF(x, y))
+        # Sample the large, medium and fine noise layers in one batch
+        noise_values = self.blob_renderer.sample_noise_layers(self._layer_cos, self._layer_sin)
+        
+        # Combine all noise layers for chaotic effect
+        total_noise = self.blob_renderer.weights @ noise_values
+        
+        # Get eye protection points
+        eye_tips = self.blob_renderer.get_eye_protection_points(self.width(), self.height())
+        protection_radius = self.width() * 0.25  # Larger protection zones
+        
+        # Apply eye protection to reduce deformation near eyes
+        amplitude = 50  # Base deformation intensity
+        protected_amplitude = self.blob_renderer.eye_safe_amplitudes(
+            center_x + self._rest_x,
+            center_y + self._rest_y,
+            amplitude, eye_tips, protection_radius
+        )
+        
+        # Apply chaotic noise to radius with eye protection
+        radius = self.base_radius + total_noise * protected_amplitude
+        
+        # Add some randomness to make it even more chaotic
+        radius += np.sin(float(self.blob_renderer.times[0]) * 2 + self._jitter_phase) * 10
         
-        return points
+        # Calculate final positions
+        xs = center_x + self._cos * radius
+        ys = center_y + self._sin * radius
+        
+        return xs, ys
 
     def paintEvent(self, event):
         """Draw the blob using the BlobRenderer"""
@@ -182,10 +152,13 @@ class ActiveWindow(QMainWindow):
         painter.fillRect(self.rect(), QColor(0, 0, 0, 0))  # Transparent background
         
         # Get the blob shape
-        points = self.create_blob_shape()
+        if self._next_shape is None:
+            self._next_shape = self.create_blob_shape()
+        xs, ys = self._next_shape
+        self._painted = self.blob_renderer.mark_painted(xs, ys, self.state, self.face_pos, self.width())
         
         # Render the blob with all 3D effects
-        self.blob_renderer.render_blob(painter, points, self.state, self.face_pos)
+        self.blob_renderer.render_blob(painter, xs, ys, self.state, self.face_pos)
         
         # Properly end the painter
         painter.end()
@@ -230,7 +203,34 @@ class AuraApp(QApplication):
         self.setup_vision_connections()
         
         # Start with the ambient orb
+        self._visible = self.ambient_window
         self.ambient_window.show()
+        
+        # One shared animation timer that only ticks the visible window
+        self.animation_timer = QTimer(self)
+        self.animation_timer.timeout.connect(self._on_animation_tick)
+        self.animation_timer.start(20)  # 50fps for smooth animation
+        
+        # Pause animation while the application is hidden or suspended
+        self.applicationStateChanged.connect(self._on_application_state_changed)
+    
+    def _on_animation_tick(self):
+        """Advance the animation of whichever window is currently shown"""
+        if self.active_window.isVisible():
+            self.active_window.animate_blob()
+        elif self.ambient_window.isVisible():
+            self.ambient_window.animate_blob()
+    
+    def _on_application_state_changed(self, state):
+        """
+        Stop the animation timer when nothing can be seen.
+        The ambient orb is meant to keep moving while other apps have focus,
+        so only the hidden/suspended states pause it, not 'inactive'.
+        """
+        if state in (Qt.ApplicationState.ApplicationHidden, Qt.ApplicationState.ApplicationSuspended):
+            self.animation_timer.stop()
+        elif not self.animation_timer.isActive():
+            self.animation_timer.start(20)
     
     def setup_vision_connections(self):
         """Connect vision signals to window state changes"""
@@ -242,28 +242,22 @@ class AuraApp(QApplication):
             
             # Connect face position signal
             self.vision_manager.vision_thread.face_position_signal.connect(self._on_face_position_updated)
-            
-            # Also connect directly to ambient window for immediate response
-            self.vision_manager.vision_thread.user_present.connect(self.ambient_window.on_user_present)
-            self.vision_manager.vision_thread.user_absent.connect(self.ambient_window.on_user_absent)
     
     def on_user_present(self):
         """Handle user presence - wake up the orb"""
         # Change both windows to 'listening' state when user is present
         self.ambient_window.state = 'listening'
         self.active_window.state = 'listening'
-        # Force redraw of both windows
-        self.ambient_window.update()
-        self.active_window.update()
+        # Only the visible window needs a redraw; the other repaints when shown
+        self._visible.update()
     
     def on_user_absent(self):
         """Handle user absence - orb goes to sleep"""
         # Change both windows to 'idle' state when user is absent
         self.ambient_window.state = 'idle'
         self.active_window.state = 'idle'
-        # Force redraw of both windows
-        self.ambient_window.update()
-        self.active_window.update()
+        # Only the visible window needs a redraw; the other repaints when shown
+        self._visible.update()
     
     def on_vision_error(self, error_message):
         """Handle vision system errors"""
@@ -281,11 +275,13 @@ class AuraApp(QApplication):
         """Switch to the active window"""
         self.ambient_window.hide()
         self.active_window.show()
+        self._visible = self.active_window
     
     def show_ambient_window(self):
         """Switch back to the ambient orb"""
         self.active_window.hide()
         self.ambient_window.show()
+        self._visible = self.ambient_window
     
     def close_active_window(self):
         """Handle closing the active window and returning to ambient mode"""
@@ -2,30 +2,153 @@
 BlobRenderer - Handles all 3D rendering logic for the chaotic blob
 """
 
-from PySide6.QtCore import Qt, QPointF
-from PySide6.QtGui import QPainter, QBrush, QColor, QPen, QPainterPath, QRadialGradient, QLinearGradient
+from PySide6.QtCore import Qt, QPointF, QRectF
+from PySide6.QtGui import QPainter, QBrush, QColor, QImage, QPen, QPainterPath, QPolygonF, QRadialGradient, QLinearGradient, QTransform
 import math
 import time
-from opensimplex import OpenSimplex
+from functools import lru_cache
+import numpy as np
+from numba import njit
+from shiboken6 import VoidPtr
+from noise import DIAGONAL_PERIOD, make_permutation, noise2_batch
+
+
+# Base color for each state the windows can put the blob in
+_STATE_COLORS = {
+    'idle': QColor(10, 10, 15),           # Very dark gray - user absent
+    'listening': QColor(0, 200, 255),     # Very bright cyan-blue - user present
+    'thinking': QColor(255, 150, 0),      # Bright orange - processing
+    'success': QColor(0, 255, 100),       # Bright green - success
+    'error': QColor(255, 50, 50),         # Bright red - error
+}
+_DEFAULT_STATE_COLOR = QColor(10, 10, 15)  # Default dark
+
+STATES = tuple(_STATE_COLORS)
+
+# Contact shadow offset in pixels
+SHADOW_OFFSET = 4
+
+# Below this blob radius the faint AO and shadow layers are not drawn
+MIN_EDGE_LAYER_DISTANCE = 40
+
+# The highlight atlas covers this many blob radii around the center (enough for
+# the tilt bias); its blob radius in device pixels is rounded up to this step
+ATLAS_EXTENT = 1.5
+ATLAS_UNIT_STEP = 32
+
+# Face positions are snapped to this many steps per axis so tracker jitter
+# doesn't cause repaints or recompute the eye tracking; eye tracking moves in
+# steps of this many pixels
+FACE_POS_STEPS = 64
+TRACKING_STEP = 2
+
+
+# A window repaints once the outline or the eyes moved by at least this many pixels
+REPAINT_THRESHOLD = 0.5
+
+
+def snap_face_pos(face_pos):
+    """Snap a normalized face position to the FACE_POS_STEPS grid the renderer works on"""
+    return (round(face_pos[0] * FACE_POS_STEPS) / FACE_POS_STEPS,
+            round(face_pos[1] * FACE_POS_STEPS) / FACE_POS_STEPS)
+
+
+# Channel offsets for the highlight, mid_light, mid_dark and shadow variations
+_VARIATION_OFFSETS = np.array([[80, 80, 80], [40, 40, 40], [-40, -40, -40], [-60, -60, -60]], dtype=np.int16)
+
+
+@lru_cache(maxsize=None)
+def _color_variations(r, g, b, a):
+    """Clamped light/dark variations of an RGBA color, memoized per color"""
+    rgb = np.clip(np.array([r, g, b], dtype=np.int16) + _VARIATION_OFFSETS, 0, 255)
+    return tuple(QColor(red, green, blue, a) for red, green, blue in rgb.tolist())
+
+
+def _make_polygon_buffer(size):
+    """
+    Create a QPolygonF with `size` points and a writable (size, 2) float64 NumPy
+    view onto its storage, so points can be updated without building QPointFs.
+    """
+    polygon = QPolygonF()
+    polygon.resize(size)
+    view = np.frombuffer(VoidPtr(polygon.data(), size * 16, True), dtype=np.float64)
+    return polygon, view.reshape(size, 2)
+
+
+@njit(cache=True, fastmath=True)
+def _blob_frame(xs, ys, tilt_x, tilt_y, outline_xy, shadow_xy):
+    """
+    One pass of the per-frame body geometry: returns the blob center and radius,
+    writes the outline leaning toward the user into outline_xy and the untilted
+    outline into shadow_xy. When there's (practically) no tilt outline_xy is left
+    untouched and the last return value is False: the shadow outline is the body.
+    """
+    n = xs.shape[0]
+    center_x = 0.0
+    center_y = 0.0
+    for i in range(n):
+        center_x += xs[i]
+        center_y += ys[i]
+    inv_n = 1.0 / n
+    center_x *= inv_n
+    center_y *= inv_n
+
+    # Largest squared distance first, one sqrt at the end
+    max_d2 = 0.0
+    for i in range(n):
+        dx = xs[i] - center_x
+        dy = ys[i] - center_y
+        d2 = dx * dx + dy * dy
+        if d2 > max_d2:
+            max_d2 = d2
+    max_distance = math.sqrt(max_d2)
+    inv_max = 1.0 / max_distance
+
+    for i in range(n):
+        shadow_xy[i, 0] = xs[i]
+        shadow_xy[i, 1] = ys[i]
+    if abs(tilt_x) + abs(tilt_y) < 1e-3:
+        return center_x, center_y, max_distance, False
+
+    # Subtle directional bias (shift slightly toward face direction)
+    bias_x = tilt_x * 40.0 * inv_max
+    bias_y = tilt_y * 40.0 * inv_max
+    for i in range(n):
+        outline_xy[i, 0] = xs[i] + bias_x * (ys[i] - center_y)
+        outline_xy[i, 1] = ys[i] + bias_y * (xs[i] - center_x)
+    return center_x, center_y, max_distance, True
+
+
+def _place_gradient(template, center, radius):
+    """Copy a template radial gradient (its stops are shared, not rebuilt) and position it"""
+    gradient = QRadialGradient(template)
+    gradient.setCenter(center)
+    gradient.setFocalPoint(center)
+    gradient.setRadius(radius)
+    return gradient
 
 
 class BlobRenderer:
     """Handles all 3D rendering logic for the chaotic blob"""
     
+    # Color palette per state, shared by every renderer:
+    # state -> (base, highlight, mid_light, mid_dark, shadow)
+    _STATE_COLOR_CACHE = {}
+    
+    # Solid white fill shared by both eyes
+    _EYE_BRUSH = QBrush(QColor(255, 255, 255, 255))
+    
     def __init__(self):
-        # Noise generation for organic blob movement
-        self.noise_gen = OpenSimplex(seed=12345)
-        self.time = 0.0
-        self.time2 = 0.0
-        self.time3 = 0.0
-        
-        # Noise parameters for layered deformation
-        self.noise_scale = 0.02
-        self.noise_scale2 = 0.03
-        self.noise_scale3 = 0.01
-        self.noise_speed = 0.02
-        self.noise_speed2 = 0.015
-        self.noise_speed3 = 0.025
+        # Layered blob deformation noise shared by both windows, one entry per
+        # layer (primary chaos, secondary, fine detail). Times stay float64 so
+        # they don't lose precision over long sessions; per-frame math is float32
+        self.times = np.zeros(3)
+        self.speeds = np.array([0.05, 0.03, 0.08])
+        self.scales = np.array([0.9, 0.5, 0.1], dtype=np.float32)
+        self.weights = np.array([0.6, 0.3, 0.1], dtype=np.float32)
+        
+        # Simplex permutation table shared by the blob layers and the eye movement noise
+        self.perm = make_permutation(12345)
         
         # Store current state and face position
         self.state = 'idle'
@@ -39,6 +162,47 @@ class BlobRenderer:
         self.right_eye_tip_x = 0
         self.right_eye_tip_y = 0
         
+        # Gradient stops built once; main lighting stops per state
+        self._templates = self._build_gradient_templates()
+        self._main_templates = {state: self._build_main_template(state) for state in STATES}
+        
+        # Rim, specular and secondary highlights baked per atlas size; main, AO and
+        # shadow brushes memoized on quantized blob geometry
+        self._highlight_atlas = lru_cache(maxsize=8)(self._build_highlight_atlas)
+        self._layer_brushes = lru_cache(maxsize=64)(self._build_layer_brushes)
+        
+        # Invisible pen shared by all blob layers
+        self._no_pen = QPen(Qt.GlobalColor.transparent, 0)
+        
+        # Outline/shadow polygon buffers keyed by point count
+        self._polygons = {}
+        
+        # Eye tracking offset and the (face_pos, w, h) it was computed for
+        self._tracking = (0.0, 0.0)
+        self._tracking_key = None
+        
+        # Eye path and its pivot keyed by rounded (length, height); they only change with window size
+        self._eye_shapes = lru_cache(maxsize=8)(self._build_eye_shape)
+        
+    def tick(self):
+        """Advance every noise layer by one animation step"""
+        self.times += self.speeds
+
+    def sample_noise_layers(self, layer_xs, layer_ys):
+        """
+        Sample every noise layer for one outline in a single batched call.
+        layer_xs, layer_ys: (layers, N) outline offsets already multiplied by self.scales.
+        Returns a (layers, N) array of noise values.
+        """
+        # The times are added to both coordinates and the noise repeats along that
+        # diagonal, so they're wrapped (seamlessly) in float64 before the sums are
+        # downcast; float32 coordinates then stay small and keep the per-tick steps
+        t = np.mod(self.times, DIAGONAL_PERIOD)[:, None]
+        xs = (layer_xs + t).astype(np.float32).ravel()
+        ys = (layer_ys + t).astype(np.float32).ravel()
+        values = noise2_batch(xs, ys, self.perm)
+        return values.reshape(layer_xs.shape)
+
     def get_eye_protection_points(self, w, h):
         """Get eye tip positions for blob protection"""
         cx = w / 2
@@ -61,15 +225,30 @@ class BlobRenderer:
         Reduce deformation amplitude near the eyes so the blob doesn't stretch inward there.
         eye_tips: list of (x, y) coordinates of the eyes' outermost tips.
         """
+        # (dist / radius) ** 2 is just the ratio of squared distances, so no sqrt is needed
+        r2 = protection_radius * protection_radius
         for tip in eye_tips:
             dx = x - tip[0]
             dy = y - tip[1]
-            dist = math.hypot(dx, dy)
-            if dist < protection_radius:
-                fade = dist / protection_radius
-                amplitude *= fade ** 2  # Stronger damping for debugging
+            d2 = dx * dx + dy * dy
+            if d2 < r2:
+                amplitude *= d2 / r2  # Stronger damping for debugging
         return amplitude
 
+    def eye_safe_amplitudes(self, xs, ys, amplitude, eye_tips, protection_radius):
+        """
+        Array version of eye_safe_amplitude: one damped amplitude per (xs[i], ys[i]).
+        """
+        amplitudes = np.full_like(xs, amplitude)
+        r2 = protection_radius * protection_radius
+        for tip in eye_tips:
+            dx = xs - tip[0]
+            dy = ys - tip[1]
+            d2 = dx * dx + dy * dy
+            inside = d2 < r2
+            amplitudes[inside] *= d2[inside] / r2
+        return amplitudes
+
     def get_eye_offset(self, tip_pos, noise_scale, noise_strength, t):
         """
         Returns a small (x, y) offset for the eye based on blob noise motion.
@@ -78,202 +257,234 @@ class BlobRenderer:
         nx = tip_pos.x() * noise_scale
         ny = tip_pos.y() * noise_scale
 
-        offset_x = self.noise_gen.noise2(x=nx, y=t) * noise_strength
-        offset_y = self.noise_gen.noise2(x=ny, y=t + 50.0) * noise_strength  # offset seed for variety
+        # Both axes in one batch; y is sampled 50 units further along for variety
+        offset_x, offset_y = noise2_batch(np.array([nx, ny]), np.array([t, t + 50.0]), self.perm) * noise_strength
 
-        return offset_x, offset_y
+        return float(offset_x), float(offset_y)
 
     def get_state_color(self, state):
         """Get the base color for a given state"""
-        if state == 'idle':
-            return QColor(10, 10, 15)       # Very dark gray - user absent
-        elif state == 'listening':
-            return QColor(0, 200, 255)     # Very bright cyan-blue - user present
-        elif state == 'thinking':
-            return QColor(255, 150, 0)     # Bright orange - processing
-        elif state == 'success':
-            return QColor(0, 255, 100)     # Bright green - success
-        elif state == 'error':
-            return QColor(255, 50, 50)     # Bright red - error
-        else:
-            return QColor(10, 10, 15)      # Default dark
+        return _STATE_COLORS.get(state, _DEFAULT_STATE_COLOR)
 
     def create_color_variations(self, base_color):
         """Create light and dark variations of the base color"""
-        highlight_color = QColor(base_color)
-        highlight_color.setRed(min(255, highlight_color.red() + 80))
-        highlight_color.setGreen(min(255, highlight_color.green() + 80))
-        highlight_color.setBlue(min(255, highlight_color.blue() + 80))
-        
-        mid_light_color = QColor(base_color)
-        mid_light_color.setRed(min(255, mid_light_color.red() + 40))
-        mid_light_color.setGreen(min(255, mid_light_color.green() + 40))
-        mid_light_color.setBlue(min(255, mid_light_color.blue() + 40))
-        
-        mid_dark_color = QColor(base_color)
-        mid_dark_color.setRed(max(0, mid_dark_color.red() - 40))
-        mid_dark_color.setGreen(max(0, mid_dark_color.green() - 40))
-        mid_dark_color.setBlue(max(0, mid_dark_color.blue() - 40))
-        
-        shadow_color = QColor(base_color)
-        shadow_color.setRed(max(0, shadow_color.red() - 60))
-        shadow_color.setGreen(max(0, shadow_color.green() - 60))
-        shadow_color.setBlue(max(0, shadow_color.blue() - 60))
-        
-        return highlight_color, mid_light_color, mid_dark_color, shadow_color
-
-    def create_main_gradient(self, center, max_distance, highlight_color, mid_light_color, base_color, mid_dark_color, shadow_color):
-        """Create the main lighting gradient"""
-        light_center = QPointF(center.x() - max_distance * 0.9, center.y() - max_distance * 0.9)
-        main_gradient = QRadialGradient(light_center, max_distance * 1.2)
-        
-        main_gradient.setColorAt(0.0, highlight_color)    # Bright highlight
-        main_gradient.setColorAt(0.2, mid_light_color)    # Light area
-        main_gradient.setColorAt(0.5, base_color)         # Base color
-        main_gradient.setColorAt(0.8, mid_dark_color)      # Shadow area
-        main_gradient.setColorAt(1.0, shadow_color)        # Deep shadow
-        
-        return main_gradient
+        return _color_variations(base_color.red(), base_color.green(), base_color.blue(), base_color.alpha())
 
-    def create_rim_gradient(self, center, max_distance):
-        """Create the rim lighting gradient"""
-        rim_gradient = QRadialGradient(center, max_distance * 1.5)
-        rim_gradient.setColorAt(0.0, QColor(255, 255, 255, 0))    # Transparent center
-        rim_gradient.setColorAt(0.7, QColor(255, 255, 255, 0))   # Still transparent
+    def _build_palette(self, state):
+        """Base color for a state followed by its light and dark variations"""
+        base_color = self.get_state_color(state)
+        return (base_color,) + self.create_color_variations(base_color)
+
+    def _get_palette(self, state):
+        """Cached palette for a state, built on first use"""
+        palette = self._STATE_COLOR_CACHE.get(state)
+        if palette is None:
+            palette = self._STATE_COLOR_CACHE[state] = self._build_palette(state)
+        return palette
+
+    def _build_gradient_templates(self):
+        """
+        Radial gradients with their color stops set once. Per-frame gradients are
+        copies of these (sharing the stops) that only get moved and resized.
+        """
+        rim_gradient = QRadialGradient()
+        rim_gradient.setColorAt(0.7, QColor(255, 255, 255, 0))   # Transparent up to here (pads to the center)
         rim_gradient.setColorAt(0.9, QColor(255, 255, 255, 30))  # Subtle rim
         rim_gradient.setColorAt(1.0, QColor(255, 255, 255, 60))  # Bright rim
         
-        return rim_gradient
-
-    def create_specular_gradient(self, center, max_distance):
-        """Create the specular highlight gradient"""
-        specular_center = QPointF(center.x() - max_distance * 0.4, center.y() - max_distance * 0.4)
-        specular_gradient = QRadialGradient(specular_center, max_distance * 0.3)
-        
+        specular_gradient = QRadialGradient()
         specular_gradient.setColorAt(0.0, QColor(255, 255, 255, 120))  # Bright highlight
         specular_gradient.setColorAt(0.3, QColor(255, 255, 255, 60))   # Fading
         specular_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))    # Transparent
         
-        return specular_gradient
-
-    def create_secondary_gradient(self, center, max_distance):
-        """Create a secondary highlight gradient"""
-        secondary_center = QPointF(center.x() + max_distance * 0.2, center.y() - max_distance * 0.2)
-        secondary_gradient = QRadialGradient(secondary_center, max_distance * 0.2)
-        
+        secondary_gradient = QRadialGradient()
         secondary_gradient.setColorAt(0.0, QColor(255, 255, 255, 40))  # Subtle highlight
         secondary_gradient.setColorAt(0.5, QColor(255, 255, 255, 20))  # Fading
         secondary_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))    # Transparent
         
-        return secondary_gradient
-
-    def create_ambient_occlusion_gradient(self, center, max_distance):
-        """Create ambient occlusion gradient"""
-        ao_gradient = QRadialGradient(center, max_distance * 1.3)
-        ao_gradient.setColorAt(0.0, QColor(0, 0, 0, 0))      # Transparent center
-        ao_gradient.setColorAt(0.6, QColor(0, 0, 0, 0))     # Still transparent
+        ao_gradient = QRadialGradient()
+        ao_gradient.setColorAt(0.6, QColor(0, 0, 0, 0))     # Transparent up to here (pads to the center)
         ao_gradient.setColorAt(0.8, QColor(0, 0, 0, 20))    # Subtle darkening
         ao_gradient.setColorAt(1.0, QColor(0, 0, 0, 40))     # Dark edges
         
-        return ao_gradient
-
-    def create_shadow_gradient(self, center, max_distance, shadow_offset):
-        """Create contact shadow gradient"""
-        shadow_center = QPointF(center.x() + shadow_offset, center.y() + shadow_offset)
-        shadow_gradient = QRadialGradient(shadow_center, max_distance * 0.8)
-        
+        shadow_gradient = QRadialGradient()
         shadow_gradient.setColorAt(0.0, QColor(0, 0, 0, 0))      # Transparent center
         shadow_gradient.setColorAt(0.3, QColor(0, 0, 0, 60))    # Soft shadow
         shadow_gradient.setColorAt(0.7, QColor(0, 0, 0, 80))    # Medium shadow
         shadow_gradient.setColorAt(1.0, QColor(0, 0, 0, 100))   # Dark shadow
         
-        return shadow_gradient
+        return {
+            'rim': rim_gradient,
+            'specular': specular_gradient,
+            'secondary': secondary_gradient,
+            'ao': ao_gradient,
+            'shadow': shadow_gradient,
+        }
+
+    def _build_main_template(self, state):
+        """Main lighting gradient stops for a state"""
+        # Highlight, base and shadow only: the mid tones sit within a few levels of
+        # the linear ramp between them, so their extra stops buy no visible shading
+        base_color, highlight_color, _, _, shadow_color = self._get_palette(state)
+        main_gradient = QRadialGradient()
+        main_gradient.setColorAt(0.0, highlight_color)
+        main_gradient.setColorAt(0.5, base_color)
+        main_gradient.setColorAt(1.0, shadow_color)
+        return main_gradient
+
+    def create_rim_gradient(self, center, max_distance):
+        """Create the rim lighting gradient"""
+        return _place_gradient(self._templates['rim'], center, max_distance * 1.5)
 
-    def render_blob(self, painter, points, state, face_pos=(0.5, 0.5)):
-        """Main rendering method - draws the complete 3D blob"""
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def create_specular_gradient(self, center, max_distance):
+        """Create the specular highlight gradient"""
+        specular_center = QPointF(center.x() - max_distance * 0.4, center.y() - max_distance * 0.4)
+        return _place_gradient(self._templates['specular'], specular_center, max_distance * 0.3)
+
+    def create_secondary_gradient(self, center, max_distance):
+        """Create a secondary highlight gradient"""
+        secondary_center = QPointF(center.x() + max_distance * 0.2, center.y() - max_distance * 0.2)
+        return _place_gradient(self._templates['secondary'], secondary_center, max_distance * 0.2)
+
+    def create_ambient_occlusion_gradient(self, center, max_distance):
+        """Create ambient occlusion gradient"""
+        return _place_gradient(self._templates['ao'], center, max_distance * 1.3)
+
+    def create_shadow_gradient(self, center, max_distance, shadow_offset):
+        """Create contact shadow gradient"""
+        shadow_center = QPointF(center.x() + shadow_offset, center.y() + shadow_offset)
+        return _place_gradient(self._templates['shadow'], shadow_center, max_distance * 0.8)
+
+    def _get_polygon_buffers(self, size):
+        """Outline and shadow polygons (with their NumPy views) for a given point count"""
+        buffers = self._polygons.get(size)
+        if buffers is None:
+            buffers = self._polygons[size] = _make_polygon_buffer(size) + _make_polygon_buffer(size)
+        return buffers
+
+    def _build_highlight_atlas(self, unit):
+        """
+        Bake the rim, specular and secondary highlights into one image where the
+        blob radius is `unit` pixels. They are white whatever the state, sit at
+        fixed offsets from the center and scale with the blob, so the image is
+        reused for any center and size by drawing it as a transformed texture brush.
+        """
+        half = unit * ATLAS_EXTENT
+        center = QPointF(half, half)
+        
+        size = math.ceil(2 * half)
+        atlas = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        atlas.fill(Qt.GlobalColor.transparent)
+        area = QRectF(0, 0, size, size)
+        
+        atlas_painter = QPainter(atlas)
+        atlas_painter.fillRect(area, self.create_rim_gradient(center, unit))
+        atlas_painter.fillRect(area, self.create_specular_gradient(center, unit))
+        atlas_painter.fillRect(area, self.create_secondary_gradient(center, unit))
+        atlas_painter.end()
+        return atlas
+
+    def _build_layer_brushes(self, state, center_x, center_y, max_distance, light_x, light_y):
+        """Build the main, AO and shadow brushes for one blob geometry"""
+        main_template = self._main_templates.get(state)
+        if main_template is None:
+            main_template = self._main_templates[state] = self._build_main_template(state)
+        center = QPointF(center_x, center_y)
         
-        # Update time for animations
-        self.time += 0.01
+        return (
+            QBrush(_place_gradient(main_template, QPointF(light_x, light_y), max_distance * 1.2)),
+            QBrush(self.create_ambient_occlusion_gradient(center, max_distance)),
+            # The shadow layer is drawn translated by SHADOW_OFFSET, so its gradient isn't offset again
+            QBrush(self.create_shadow_gradient(center, max_distance, 0)),
+        )
+
+    def _highlight_brush(self, center_x, center_y, max_distance, ratio):
+        """Texture brush that maps the cached highlight atlas onto the blob at this center and size"""
+        # Size the atlas from the blob's radius on the device, so small blobs bake small images
+        unit = max(ATLAS_UNIT_STEP, math.ceil(max_distance * ratio / ATLAS_UNIT_STEP) * ATLAS_UNIT_STEP)
+        atlas = self._highlight_atlas(unit)
+        scale = max_distance / unit
+        half = unit * ATLAS_EXTENT
+        placement = QTransform()
+        placement.translate(center_x, center_y)
+        placement.scale(scale, scale)
+        placement.translate(-half, -half)
+        
+        brush = QBrush(atlas)
+        brush.setTransform(placement)
+        return brush
+
+    def render_blob(self, painter, xs, ys, state, face_pos=(0.5, 0.5)):
+        """
+        Main rendering method - draws the complete 3D blob.
+        xs, ys: NumPy arrays with the outline point coordinates.
+        """
+        # Only touch the painter state when the host hasn't enabled antialiasing already
+        if not painter.testRenderHint(QPainter.RenderHint.Antialiasing):
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Store state and face position for helper methods
+        # Store state and (snapped) face position for helper methods
         self.state = state
-        self.face_pos = face_pos
+        self.face_pos = face_pos = snap_face_pos(face_pos)
+        
+        # The body changes with the outline on every tick, so it is drawn straight
+        # onto the host painter; the highlight atlas brush wants filtered scaling
+        if not painter.testRenderHint(QPainter.RenderHint.SmoothPixmapTransform):
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self._draw_body(painter, xs, ys, state)
+        
+        # Draw parametric symbiote eyes (animated independently, never cached)
+        self._draw_symbiote_eyes(painter)
 
-         # Simulate blob "head tilt" toward the user
+    def _draw_body(self, painter, xs, ys, state):
+        """Draw the shadowed, lit blob body (everything except the eyes)"""
+        # Simulate blob "head tilt" toward the user
         tilt_x = (self.face_pos[0] - 0.5) * 0.5   # -0.5 to +0.5 range → left/right
         tilt_y = (self.face_pos[1] - 0.5) * 0.4   # -0.4 to +0.4 range → up/down
 
         
-        # Calculate blob center and dimensions
-        center_x = sum(point.x() for point in points) / len(points)
-        center_y = sum(point.y() for point in points) / len(points)
-        center = QPointF(center_x, center_y)
-        max_distance = max(math.sqrt((point.x() - center_x)**2 + (point.y() - center_y)**2) for point in points)
-
-        # Apply subtle directional bias so blob leans toward the user
-        biased_points = []
-        for p in points:
-            dx = (p.x() - center_x)
-            dy = (p.y() - center_y)
-            # Shift slightly toward face direction
-            new_x = p.x() + tilt_x * 40.0 * (dy / max_distance)
-            new_y = p.y() + tilt_y * 40.0 * (dx / max_distance)
-            biased_points.append(QPointF(new_x, new_y))
-
-        path = QPainterPath()
-        path.moveTo(biased_points[0])
-        for point in biased_points[1:]:
-            path.lineTo(point)
-        path.closeSubpath()
-        
-        # Get base color and create variations
-        base_color = self.get_state_color(state)
-        highlight_color, mid_light_color, mid_dark_color, shadow_color = self.create_color_variations(base_color)
-        
-        # Create all gradients
-        # Shift lighting toward tilt direction (like a face turning)
-        light_center = QPointF(center.x() - tilt_x * max_distance * 2.2,center.y() - tilt_y * max_distance * 2.2)
-
-        main_gradient = QRadialGradient(light_center, max_distance * 1.2)
-        main_gradient.setColorAt(0.0, highlight_color)
-        main_gradient.setColorAt(0.2, mid_light_color)
-        main_gradient.setColorAt(0.5, base_color)
-        main_gradient.setColorAt(0.8, mid_dark_color)
-        main_gradient.setColorAt(1.0, shadow_color)
-
-        rim_gradient = self.create_rim_gradient(center, max_distance)
-        specular_gradient = self.create_specular_gradient(center, max_distance)
-        secondary_gradient = self.create_secondary_gradient(center, max_distance)
-        ao_gradient = self.create_ambient_occlusion_gradient(center, max_distance)
-        
-        # Create shadow path
-        shadow_offset = 4
-        shadow_path = QPainterPath()
-        shadow_points = [QPointF(point.x() + shadow_offset, point.y() + shadow_offset) for point in points]
-        shadow_path.moveTo(shadow_points[0])
-        for point in shadow_points[1:]:
-            shadow_path.lineTo(point)
-        shadow_path.closeSubpath()
-        
-        shadow_gradient = self.create_shadow_gradient(center, max_distance, shadow_offset)
-        
-        # Draw all layers in correct order
-        self._draw_layer(painter, ao_gradient, path)  # Ambient occlusion first
-        self._draw_layer(painter, shadow_gradient, shadow_path)  # Shadow second
-        self._draw_layer(painter, main_gradient, path)  # Main blob third
-        self._draw_layer(painter, rim_gradient, path)  # Rim lighting fourth
-        self._draw_layer(painter, specular_gradient, path)  # Specular highlight fifth
-        self._draw_layer(painter, secondary_gradient, path)  # Secondary highlight sixth
-        
-        # Draw parametric symbiote eyes
-        self._draw_symbiote_eyes(painter)
-
-    def _draw_layer(self, painter, gradient, path):
-        """Helper method to draw a single layer"""
-        painter.setPen(QPen(Qt.GlobalColor.transparent, 0))
-        painter.setBrush(QBrush(gradient))
-        painter.drawPath(path)
+        # Reused polygons whose point storage is written directly through NumPy views
+        outline_poly, outline_xy, shadow_poly, shadow_xy = self._get_polygon_buffers(len(xs))
+
+        # Blob center and dimensions, plus the outline leaning toward the user
+        # (body) and the untilted one (shadow, drawn shifted by SHADOW_OFFSET)
+        center_x, center_y, max_distance, tilted = _blob_frame(xs, ys, tilt_x, tilt_y, outline_xy, shadow_xy)
+        if not tilted:
+            outline_poly = shadow_poly  # Facing straight on: the body is the untilted outline
+        
+        # Fetch the main, AO and shadow brushes, quantizing the geometry (center and
+        # light to 4 px, radius to 2 px) so nearly static frames reuse cached
+        # gradients; the highlights come from the baked atlas
+        light_x = center_x - tilt_x * max_distance * 2.2
+        light_y = center_y - tilt_y * max_distance * 2.2
+        main_brush, ao_brush, shadow_brush = self._layer_brushes(
+            state,
+            round(center_x / 4) * 4, round(center_y / 4) * 4,
+            max(2, round(max_distance / 2) * 2),
+            round(light_x / 4) * 4, round(light_y / 4) * 4
+        )
+        
+        # Draw all layers in correct order; only the brush changes between layers.
+        # The outline layers are filled straight from the polygon, skipping the
+        # QPainterPath conversion in the raster engine. AO and shadow peak at 40/255
+        # and 100/255 alpha; they're skipped on small blobs, and AO and the
+        # highlights also on the near-black idle body where they can't be seen
+        painter.setPen(self._no_pen)
+        if max_distance >= MIN_EDGE_LAYER_DISTANCE:
+            if state != 'idle':
+                painter.setBrush(ao_brush)  # Ambient occlusion first
+                painter.drawPolygon(outline_poly)
+            painter.setBrush(shadow_brush)  # Shadow second
+            painter.translate(SHADOW_OFFSET, SHADOW_OFFSET)
+            painter.drawPolygon(shadow_poly)
+            painter.translate(-SHADOW_OFFSET, -SHADOW_OFFSET)
+        painter.setBrush(main_brush)  # Main blob third
+        painter.drawPolygon(outline_poly)
+        if state != 'idle':
+            painter.setBrush(self._highlight_brush(
+                center_x, center_y, max_distance, painter.device().devicePixelRatio()
+            ))  # Rim, specular and secondary highlights in one fill
+            painter.drawPolygon(outline_poly)
 
 
     # --- Build QPainterPath from samplers ---
@@ -308,9 +519,66 @@ class BlobRenderer:
         return p
 
 
+    def _build_eye_shape(self, length, height):
+        """Build the eye path for an integer size along with the pivot it rotates around"""
+        eye = self.build_bezier_symbiote_eye(length, height)
+        return eye, eye.boundingRect().center()
+
+    def get_symbiote_eye(self, length, height):
+        """Return the cached (path, pivot) for this size, rounded to whole pixels so it hits"""
+        return self._eye_shapes(round(length), round(height))
+
+    def mark_painted(self, xs, ys, state, face_pos, w):
+        """
+        Record of what a window just painted, to hand back to needs_repaint on
+        its next tick. Windows keep their own record since the renderer is shared.
+        """
+        return xs, ys, state, snap_face_pos(face_pos), self.eye_motion(w)
+
+    def needs_repaint(self, painted, xs, ys, state, face_pos, w):
+        """
+        True when a window whose last paint is described by `painted` (from
+        mark_painted, None if it hasn't painted yet) should repaint: the state or
+        snapped face position changed, or the outline or the eyes (breathing /
+        glue wobble) moved by REPAINT_THRESHOLD pixels or more.
+        """
+        if painted is None:
+            return True
+        painted_xs, painted_ys, painted_state, painted_face, painted_eyes = painted
+        if state != painted_state or snap_face_pos(face_pos) != painted_face:
+            return True
+        if (np.abs(xs - painted_xs).max() >= REPAINT_THRESHOLD
+                or np.abs(ys - painted_ys).max() >= REPAINT_THRESHOLD):
+            return True
+        eyes = self.eye_motion(w)
+        return max(abs(now - then) for now, then in zip(eyes, painted_eyes)) >= REPAINT_THRESHOLD
+
+    def eye_motion(self, w, t=None):
+        """
+        Time driven eye movement in pixels for a window of width w: the breathing
+        offset and the shared glue wobble (x, y). t defaults to now (time.time() * 0.5).
+        needs_repaint compares this between ticks to know when the eyes moved; the
+        scale pulse follows the breathing phase with a smaller reach, so it's covered.
+        """
+        if t is None:
+            t = time.time() * 0.5
+        breath_amplitude = w * 0.006   # how far they move together
+        breath_speed = 2.0              # breathing speed
+        breath_offset = math.sin(t * breath_speed) * breath_amplitude
+
+        # --- Shared blob "glue" noise offset ---
+        # A couple of incommensurate sines per axis; a few pixels of wobble
+        # doesn't need real noise
+        shared_noise_x = (math.sin(t * 1.7) + 0.5 * math.sin(t * 2.9)) * 3.2
+        shared_noise_y = (math.sin(t * 1.3 + 1.0) + 0.5 * math.sin(t * 2.3 + 2.0)) * 3.2
+        return breath_offset, shared_noise_x, shared_noise_y
+
     def _draw_symbiote_eyes(self, painter):
-        """Draws Venom-style eyes using cubic Bézier curves."""
-        painter.save()
+        """
+        Draws Venom-style eyes using cubic Bézier curves.
+        The painter transform is never touched, so instead of save()/restore()
+        this only leaves the eye brush and pen set on the painter.
+        """
         w = painter.window().width()
         h = painter.window().height()
         
@@ -318,10 +586,6 @@ class BlobRenderer:
         cx = w / 2
         cy = h / 2
         
-        # Face tracking offsets
-        look_x = (self.face_pos[0] - 0.5) * 2.0
-        look_y = (self.face_pos[1] - 0.5) * 2.0
-        
         # Eye dimensions
         eye_length = w * 0.20
         eye_height = h * 0.12
@@ -330,54 +594,53 @@ class BlobRenderer:
         eye_spacing = w * 0.2
         eye_y_offset = -h * 0.05
         
-        # Face tracking movement
-        tracking_x = look_x * (w * 0.03)
-        tracking_y = look_y * (h * 0.03)
-        
-        # --- Time and breathing motion ---
+        # Face tracking movement in whole steps, only recomputed when the face or size changed
+        tracking_key = (self.face_pos, w, h)
+        if tracking_key != self._tracking_key:
+            look_x = (self.face_pos[0] - 0.5) * 2.0
+            look_y = (self.face_pos[1] - 0.5) * 2.0
+            self._tracking = (round(look_x * (w * 0.03) / TRACKING_STEP) * TRACKING_STEP,
+                              round(look_y * (h * 0.03) / TRACKING_STEP) * TRACKING_STEP)
+            self._tracking_key = tracking_key
+        tracking_x, tracking_y = self._tracking
+        
+        # --- Time driven motion (breathing and shared glue wobble) ---
         t = time.time() * 0.5
-        breath_amplitude = w * 0.006   # how far they move together
-        breath_speed = 2.0              # breathing speed
-        breath_offset = math.sin(t * breath_speed) * breath_amplitude
-
-        # --- Shared blob "glue" noise offset ---
-        shared_noise_x = self.noise_gen.noise2(t * 0.3, 10.0) * 8.0
-        shared_noise_y = self.noise_gen.noise2(t * 0.3, 20.0) * 8.0
+        breath_offset, shared_noise_x, shared_noise_y = self.eye_motion(w, t)
         shared_offset = (shared_noise_x, shared_noise_y)
         
         # --- Build eye path ---
-        eye = self.build_bezier_symbiote_eye(eye_length, eye_height)
-        rect = eye.boundingRect()
-        pivot = rect.center()
+        eye, pivot = self.get_symbiote_eye(eye_length, eye_height)
         
         # Paint settings
-        painter.setBrush(QBrush(QColor(255, 255, 255, 255)))
+        painter.setBrush(self._EYE_BRUSH)
         painter.setPen(Qt.PenStyle.NoPen)
 
         # Shared scale (breathing size pulse)
         scale_factor = 1.0 + math.sin(t * 2.0) * 0.005
 
+        # Both eyes are mapped into one path so they go out in a single drawPath.
+        # Breathing moves them in opposite directions, so the pair is rebuilt per frame.
+
         # --- LEFT EYE ---
-        painter.save()
-        painter.translate(cx - eye_spacing + tracking_x - breath_offset + shared_offset[0],
-                        cy + eye_y_offset + tracking_y + shared_offset[1])
-        painter.translate(pivot)
-        painter.rotate(50)  # inward tilt
-        painter.translate(-pivot)
-        painter.scale(scale_factor, scale_factor)
-        painter.drawPath(eye)
-        painter.restore()
+        left = QTransform()
+        left.translate(cx - eye_spacing + tracking_x - breath_offset + shared_offset[0],
+                       cy + eye_y_offset + tracking_y + shared_offset[1])
+        left.translate(pivot.x(), pivot.y())
+        left.rotate(50)  # inward tilt
+        left.translate(-pivot.x(), -pivot.y())
+        left.scale(scale_factor, scale_factor)
 
         # --- RIGHT EYE ---
-        painter.save()
-        painter.translate(cx + eye_spacing + tracking_x + breath_offset + shared_offset[0],
+        right = QTransform()
+        right.translate(cx + eye_spacing + tracking_x + breath_offset + shared_offset[0],
                         cy + eye_y_offset + tracking_y + shared_offset[1])
-        painter.scale(-1, 1)  # mirror horizontally
-        painter.translate(pivot)
-        painter.rotate(50)  # inward tilt
-        painter.translate(-pivot)
-        painter.scale(scale_factor, scale_factor)
-        painter.drawPath(eye)
-        painter.restore()
-
-        painter.restore()
+        right.scale(-1, 1)  # mirror horizontally
+        right.translate(pivot.x(), pivot.y())
+        right.rotate(50)  # inward tilt
+        right.translate(-pivot.x(), -pivot.y())
+        right.scale(scale_factor, scale_factor)
+
+        both = left.map(eye)
+        both.addPath(right.map(eye))
+        painter.drawPath(both)
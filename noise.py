@@ -0,0 +1,83 @@
+"""
+Noise - Batched 2D simplex noise compiled with Numba
+Based on Stefan Gustavson's reference implementation of 2D simplex noise
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+
+# Skewing / unskewing factors for 2D
+F2 = 0.5 * (math.sqrt(3.0) - 1.0)
+G2 = (3.0 - math.sqrt(3.0)) / 6.0
+
+# Shifting both coordinates by this much moves exactly 256 cells along the
+# skewed lattice, so noise2(x + DIAGONAL_PERIOD, y + DIAGONAL_PERIOD) == noise2(x, y)
+DIAGONAL_PERIOD = 256.0 / math.sqrt(3.0)
+
+# Gradient directions (the 12 edge midpoints of a cube, projected to 2D)
+GRAD_X = np.array([1, -1, 1, -1, 1, -1, 1, -1, 0, 0, 0, 0], dtype=np.float64)
+GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 0, 0, 1, -1, 1, -1], dtype=np.float64)
+
+
+def make_permutation(seed):
+    """Build the doubled (512 entry) permutation table for a given seed"""
+    perm = np.random.default_rng(seed).permutation(256).astype(np.int64)
+    return np.concatenate((perm, perm))
+
+
+@njit(cache=True, fastmath=True)
+def _corner(perm, ii, jj, x, y):
+    """Contribution of a single simplex corner"""
+    t = 0.5 - x * x - y * y
+    if t < 0.0:
+        return 0.0
+    gi = perm[ii + perm[jj]] % 12
+    t *= t
+    return t * t * (GRAD_X[gi] * x + GRAD_Y[gi] * y)
+
+
+@njit(cache=True, fastmath=True)
+def noise2(x, y, perm):
+    """2D simplex noise at a single point, roughly in the range [-1, 1]"""
+    # Skew the input space to find the simplex cell we're in
+    s = (x + y) * F2
+    i = math.floor(x + s)
+    j = math.floor(y + s)
+    t = (i + j) * G2
+    x0 = x - (i - t)
+    y0 = y - (j - t)
+
+    # Pick the lower or upper triangle of the cell
+    if x0 > y0:
+        i1, j1 = 1, 0
+    else:
+        i1, j1 = 0, 1
+
+    x1 = x0 - i1 + G2
+    y1 = y0 - j1 + G2
+    x2 = x0 - 1.0 + 2.0 * G2
+    y2 = y0 - 1.0 + 2.0 * G2
+
+    ii = i & 255
+    jj = j & 255
+    n0 = _corner(perm, ii, jj, x0, y0)
+    n1 = _corner(perm, ii + i1, jj + j1, x1, y1)
+    n2 = _corner(perm, ii + 1, jj + 1, x2, y2)
+
+    # Scale the result to cover [-1, 1]
+    return 70.0 * (n0 + n1 + n2)
+
+
+@njit(cache=True, fastmath=True)
+def noise2_batch(xs, ys, perm):
+    """
+    2D simplex noise for every (xs[k], ys[k]) pair in one call.
+    The result has the same dtype as xs (float32 inputs give float32 noise).
+    """
+    out = np.empty_like(xs)
+    for k in range(xs.shape[0]):
+        out[k] = noise2(xs[k], ys[k], perm)
+    return out
@@ -14,6 +14,7 @@ logging.getLogger('absl').setLevel(logging.ERROR)
 
 import cv2
 import mediapipe as mp
+import numpy as np
 from PySide6.QtCore import QThread, Signal, Qt
 import time
 
@@ -39,12 +40,26 @@ class VisionThread(QThread):
     # NEW SIGNAL: Emits the normalized (x, y) coordinates of the face
     # (0.0, 0.0) is top-left, (1.0, 1.0) is bottom-right.
     face_position_signal = Signal(float, float)
+    
+    # --- Processing Settings ---
+    # Face Mesh only runs at this rate; the face moves slowly compared to the camera
+    PROCESS_INTERVAL = 1 / 15
+    # Frames are downscaled to this size before landmark detection
+    PROCESS_SIZE = (320, 240)
+    # Weight of the newest sample in the face position moving average
+    FACE_SMOOTHING = 0.2
+    # The face position is re-emitted once it moved this much (|dx| + |dy|)...
+    EMIT_DELTA = 0.005
+    # ...or at least this often (seconds) while a face is visible
+    EMIT_INTERVAL = 0.1
 
     # --- Initialization ---
     def __init__(self, parent=None):
         super().__init__(parent)
         self.running = False
         self._user_was_present = False # Internal state tracking
+        self._smoothed_pos = None # Moving average of the face position
+        self._last_emit = (0.0, 0.0, 0.0) # (x, y, time) of the last emitted position
 
     # --- Main Thread Logic ---
     def run(self):
@@ -55,9 +70,10 @@ class VisionThread(QThread):
         
         # We use 'with' to auto-manage resources.
         # max_num_faces=1 makes it faster.
+        # Only the nose tip is read, so the iris/lip refinement model is left off.
         with mp_face_mesh.FaceMesh(
             max_num_faces=1,
-            refine_landmarks=True,
+            refine_landmarks=False,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5) as face_mesh:
 
@@ -66,26 +82,48 @@ class VisionThread(QThread):
                 cap = cv2.VideoCapture(0)
                 if not cap.isOpened():
                     raise IOError("Cannot open webcam")
+                # Ask for 640x480 MJPG instead of the (often 720p YUYV) driver default,
+                # and keep a single buffered frame so reads are never stale
+                cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             except Exception as e:
                 self.error_occurred.emit(f"Camera Error: {e}")
                 self.running = False
                 return # Exit the run method
 
+            # Reused frame buffers for the downscaled BGR frame and its RGB copy
+            width, height = self.PROCESS_SIZE
+            small_image = np.empty((height, width, 3), dtype=np.uint8)
+            rgb_image = np.empty_like(small_image)
+
             # --- Main Processing Loop ---
+            last_process = 0.0
             while self.running:
-                success, image = cap.read()
-                if not success:
+                # Keep draining the camera at its own rate (grab() skips decoding)
+                # and only decode the latest grabbed frame when a cycle is due
+                if not cap.grab():
                     # If we fail to grab a frame, wait and try again
                     time.sleep(0.1)
                     continue
+                if time.monotonic() - last_process < self.PROCESS_INTERVAL:
+                    continue
 
-                # Get frame dimensions
-                frame_height, frame_width, _ = image.shape
+                success, image = cap.retrieve()
+                if not success:
+                    time.sleep(0.1)
+                    continue
+                last_process = time.monotonic()
 
+                # Landmarks are normalized, so a smaller frame gives the same positions
+                cv2.resize(image, self.PROCESS_SIZE, dst=small_image, interpolation=cv2.INTER_AREA)
+
+                # Convert from BGR (OpenCV) to RGB (MediaPipe) into the reused buffer
+                rgb_image.setflags(write=True)
+                cv2.cvtColor(small_image, cv2.COLOR_BGR2RGB, dst=rgb_image)
                 # To improve performance, mark the image as not writeable
-                image.setflags(write=False)
-                # Convert from BGR (OpenCV) to RGB (MediaPipe)
-                rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+                rgb_image.setflags(write=False)
 
                 # Process the image and find face landmarks
                 results = face_mesh.process(rgb_image)
@@ -109,11 +147,27 @@ class VisionThread(QThread):
                     norm_x = 1.0 - nose_tip.x
                     norm_y = nose_tip.y
 
-                    # Emit the new signal with the coordinates
-                    self.face_position_signal.emit(norm_x, norm_y)
+                    # Smooth out landmark jitter with an exponential moving average
+                    if self._smoothed_pos is None:
+                        self._smoothed_pos = (norm_x, norm_y)
+                    else:
+                        a = self.FACE_SMOOTHING
+                        self._smoothed_pos = (self._smoothed_pos[0] + a * (norm_x - self._smoothed_pos[0]),
+                                              self._smoothed_pos[1] + a * (norm_y - self._smoothed_pos[1]))
+                    norm_x, norm_y = self._smoothed_pos
+
+                    # Emit the new signal with the coordinates, but only when the face
+                    # actually moved (or periodically) so jitter doesn't cause repaints
+                    last_x, last_y, last_t = self._last_emit
+                    now = time.monotonic()
+                    if (abs(norm_x - last_x) + abs(norm_y - last_y) > self.EMIT_DELTA
+                            or now - last_t >= self.EMIT_INTERVAL):
+                        self.face_position_signal.emit(norm_x, norm_y)
+                        self._last_emit = (norm_x, norm_y, now)
                     
                 else:
-                    pass  # No face detected
+                    # No face detected; start the average afresh when one reappears
+                    self._smoothed_pos = None
                 
                 # --- State Change Emission ---
                 # This logic ensures we only emit signals on a *change* of state
@@ -126,10 +180,6 @@ class VisionThread(QThread):
                 
                 # Update the internal state
                 self._user_was_present = user_is_present
-                
-                # Small sleep to yield the thread and not max out the CPU
-                # MediaPipe is fast, but we don't need 1000fps
-                time.sleep(1/60) # Aim for 60fps
 
             # --- Cleanup ---
             cap.release()